@@ -29,6 +29,21 @@ class FunctionCallingQueryGenerator(QueryGenerator):
         self._system_prompt = prompt or DEFAULT_SYSTEM_PROMPT
         self._function_description = \
             function_description or DEFAULT_FUNCTION_DESCRIPTION
+        # The function definition never changes, so it is built once instead of
+        # on every request
+        self._function = Function(
+            name="query_knowledgebase",
+            description=self._function_description,
+            parameters=FunctionParameters(
+                required_properties=[
+                    FunctionArrayProperty(
+                        name="queries",
+                        items_type="string",
+                        description='List of queries to send to the search engine.',
+                    ),
+                ]
+            ),
+        )
         self._history_pruner = RaisingHistoryPruner()
 
     def generate(self,
@@ -58,19 +73,3 @@ class FunctionCallingQueryGenerator(QueryGenerator):
                         messages: Messages,
                         max_prompt_tokens: int) -> List[Query]:
         raise NotImplementedError
-
-    @property
-    def _function(self) -> Function:
-        return Function(
-            name="query_knowledgebase",
-            description=self._function_description,
-            parameters=FunctionParameters(
-                required_properties=[
-                    FunctionArrayProperty(
-                        name="queries",
-                        items_type="string",
-                        description='List of queries to send to the search engine.',
-                    ),
-                ]
-            ),
-        )
@@ -45,7 +45,32 @@ class AnyscaleLLM(OpenAILLM):
         *,
         max_tokens: Optional[int] = None,
         model_params: Optional[dict] = None,
+        validate_arguments: bool = True,
     ) -> dict:
+        self._verify_function_calling_support(model_params)
+        return super().enforced_function_call(
+            system_prompt, chat_history, function,
+            max_tokens=max_tokens, model_params=model_params,
+            validate_arguments=validate_arguments
+        )
+
+    async def aenforced_function_call(self,
+                                      system_prompt: str,
+                                      chat_history: Messages,
+                                      function: Function,
+                                      *,
+                                      max_tokens: Optional[int] = None,
+                                      model_params: Optional[dict] = None,
+                                      validate_arguments: bool = True,
+                                      ) -> dict:
+        self._verify_function_calling_support(model_params)
+        return await super().aenforced_function_call(
+            system_prompt, chat_history, function,
+            max_tokens=max_tokens, model_params=model_params,
+            validate_arguments=validate_arguments
+        )
+
+    def _verify_function_calling_support(self, model_params: Optional[dict]):
         model = self.model_name
         if model_params and "model" in model_params:
             model = model_params["model"]
@@ -56,18 +81,3 @@ class AnyscaleLLM(OpenAILLM):
                 "Pleaes check following link for details: "
                 "https://docs.endpoints.anyscale.com/guides/function-calling"
             )
-        else:
-            return super().enforced_function_call(
-                system_prompt, chat_history, function,
-                max_tokens=max_tokens, model_params=model_params
-            )
-
-    def aenforced_function_call(self,
-                                system_prompt: str,
-                                chat_history: Messages,
-                                function: Function,
-                                *,
-                                max_tokens: Optional[int] = None,
-                                model_params: Optional[dict] = None
-                                ):
-        raise NotImplementedError()
@@ -1,10 +1,64 @@
 import os
-from typing import Optional, Any
+import threading
+from functools import lru_cache
+from typing import Optional, Any, Dict, Tuple
 
+import httpx
 import openai
 
 from canopy.llm import OpenAILLM
 
+HTTP_CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=20,
+                                      max_connections=100,
+                                      keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+# Retries are left to the OpenAI client alone (max_retries=2, with backoff), which
+# retries connection errors, timeouts, 429s and 5xx. With the 10s connect timeout,
+# an unreachable endpoint thus fails after 3 connection attempts (~30s + backoff).
+# The default httpx transport is kept, so the HTTP_PROXY, HTTPS_PROXY, ALL_PROXY
+# and NO_PROXY environment variables are still honoured.
+HTTP_CLIENT_PARAMS: Dict[str, Any] = dict(limits=HTTP_CONNECTION_LIMITS,
+                                          timeout=HTTP_TIMEOUT,
+                                          follow_redirects=True)
+
+
+def _prewarm_connection(http_client: httpx.Client, url: str):
+    try:
+        http_client.head(url)
+    except (httpx.HTTPError, httpx.InvalidURL):
+        # Best effort only, any real connection problem will surface on
+        # the first request
+        pass
+
+
+@lru_cache(maxsize=32)
+def _prewarm_connection_once(http_client: httpx.Client, url: str):
+    # Cached only to make sure each shared client is pre-warmed at most once
+    threading.Thread(target=_prewarm_connection,
+                     args=(http_client, url),
+                     daemon=True).start()
+
+
+@lru_cache(maxsize=32)
+def _get_azure_client(azure_deployment: str,
+                      azure_endpoint: Optional[str],
+                      api_version: str,
+                      api_key: Optional[str],
+                      organization: Optional[str],
+                      ) -> Tuple[openai.AzureOpenAI, httpx.Client]:
+    # Instances sharing the same configuration share one client, and with it
+    # the underlying HTTP connection pool.
+    http_client = httpx.Client(**HTTP_CLIENT_PARAMS)
+    client = openai.AzureOpenAI(
+        azure_deployment=azure_deployment,
+        api_key=api_key,
+        api_version=api_version,
+        azure_endpoint=azure_endpoint,  # type: ignore
+        organization=organization,
+        http_client=http_client,
+    )
+    return client, http_client
+
 
 class AzureOpenAILLM(OpenAILLM):
     """
@@ -27,6 +81,7 @@ class AzureOpenAILLM(OpenAILLM):
                  api_key: Optional[str] = None,
                  api_version: str = "2023-12-01-preview",
                  azure_endpoint: Optional[str] = None,
+                 prewarm: bool = True,
                  **kwargs: Any,
                  ):
         """
@@ -37,6 +92,7 @@ class AzureOpenAILLM(OpenAILLM):
             api_key: Your Azure OpenAI API key. Defaults to None (uses the "AZURE_OPENAI_API_KEY" environment variable).
             api_version: The Azure OpenAI API version to use. Defaults to "2023-12-01-preview".
             azure_endpoint: The url of your Azure OpenAI service endpoint. Defaults to None (uses the "AZURE_OPENAI_ENDPOINT" environment variable).
+            prewarm: Whether to open a connection to the Azure endpoint in the background (once per shared client), so that the first request doesn't pay for the TCP and TLS handshakes. Defaults to True.
             **kwargs: Generation default parameters to use for each request.
 
 
@@ -48,14 +104,20 @@ class AzureOpenAILLM(OpenAILLM):
 
         """  # noqa: E501
         self.model_name = model_name
+        self._azure_endpoint = azure_endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
+
+        # Resolve the environment variables here rather than inside the
+        # client, so that they are part of the client cache key
+        self._client_params: Dict[str, Any] = dict(
+            azure_deployment=model_name,
+            azure_endpoint=self._azure_endpoint,
+            api_version=api_version,
+            api_key=api_key or os.getenv("AZURE_OPENAI_API_KEY"),
+            organization=os.getenv("OPENAI_ORG_ID"),
+        )
 
         try:
-            self._client = openai.AzureOpenAI(
-                azure_deployment=model_name,
-                api_key=api_key,
-                api_version=api_version,
-                azure_endpoint=azure_endpoint,  # type: ignore
-            )
+            self._client, http_client = _get_azure_client(**self._client_params)
         except (openai.OpenAIError, ValueError) as e:
             raise RuntimeError(
                 "Failed to connect to Azure OpenAI, please make sure that the "
@@ -64,8 +126,19 @@ class AzureOpenAILLM(OpenAILLM):
                 f"Underlying Error:\n{self._format_openai_error(e)}"
             ) from e
 
+        if prewarm and self._azure_endpoint is not None:
+            _prewarm_connection_once(http_client, self._azure_endpoint)
+
         self.default_model_params = kwargs
 
+    def _create_async_client(self) -> openai.AsyncOpenAI:
+        # Async HTTP clients are bound to the event loop they were first used in,
+        # so unlike the sync client this one is not shared between instances
+        return openai.AsyncAzureOpenAI(
+            **self._client_params,
+            http_client=httpx.AsyncClient(**HTTP_CLIENT_PARAMS),
+        )
+
     @property
     def available_models(self):
         raise NotImplementedError(
@@ -82,7 +155,7 @@ class AzureOpenAILLM(OpenAILLM):
         elif isinstance(e, openai.APIConnectionError):
             raise RuntimeError(
                 f"Failed to connect to your Azure OpenAI endpoint, please make sure "
-                f"that the provided endpoint {os.getenv('AZURE_OPENAI_ENDPOINT')} "
+                f"that the provided endpoint {self._azure_endpoint} "
                 f"is correct. Underlying Error:\n{self._format_openai_error(e)}"
             ) from e
         elif isinstance(e, openai.NotFoundError):
@@ -1,6 +1,6 @@
 import time
 from copy import deepcopy
-from typing import Union, Iterable, Optional, Any, Dict, List
+from typing import Union, Iterable, AsyncIterable, Optional, Any, Dict, List
 
 from tenacity import retry, stop_after_attempt
 
@@ -254,7 +254,7 @@ class CohereLLM(BaseLLM):
                                max_generated_tokens: Optional[int] = None,
                                model_params: Optional[dict] = None,
                                ) -> Union[ChatResponse,
-                                          Iterable[StreamingChatChunk]]:
+                                          AsyncIterable[StreamingChatChunk]]:
         raise NotImplementedError("Cohere LLM doesn't support async chat completion")
 
     async def agenerate_queries(self,
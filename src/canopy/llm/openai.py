@@ -1,11 +1,15 @@
-from copy import deepcopy
-from typing import Union, Iterable, Optional, Any, Dict, cast
+import asyncio
+from functools import lru_cache, cached_property
+from typing import (Union, Iterable, AsyncIterable, Optional, Any, Callable, Dict,
+                    List, Tuple, cast)
 
+import fastjsonschema
 import jsonschema
 import openai
 import json
 
-from openai import Stream
+from openai import Stream, AsyncStream
+from pydantic import TypeAdapter
 from openai.types.chat import (ChatCompletionToolParam, ChatCompletionChunk,
                                ChatCompletion)
 from tenacity import (
@@ -13,11 +17,58 @@ from tenacity import (
     stop_after_attempt,
     retry_if_exception_type,
 )
+
+try:
+    # orjson's JSONDecodeError subclasses json.JSONDecodeError, so the retry
+    # policy below applies to both parsers
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 from canopy.llm import BaseLLM
 from canopy.llm.models import Function
 from canopy.models.api_models import ChatResponse, StreamingChatChunk
 from canopy.models.data_models import Messages, Context, SystemMessage
 
+# Serializes a whole list of messages in a single call, instead of calling
+# `model_dump()` on each message separately
+_MESSAGES_ADAPTER = TypeAdapter(Messages)
+
+
+def _compile_validator(schema: dict) -> Callable[[Any], None]:
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    reference_validator = validator_cls(schema)
+    fast_validate = fastjsonschema.compile(schema)
+
+    def validate(instance: Any) -> None:
+        try:
+            fast_validate(instance)
+        except fastjsonschema.JsonSchemaException:
+            # Let jsonschema have the final word, so that callers keep getting
+            # its descriptive `jsonschema.ValidationError`
+            reference_validator.validate(instance)
+
+    return validate
+
+
+@lru_cache(maxsize=256)
+def _get_function_spec(function_json: str
+                       ) -> Tuple[Dict[str, Any], Callable[[Any], None]]:
+    # Function objects are usually rebuilt for every call, so the cache is keyed
+    # by their serialized form rather than by identity.
+    # Returns the function related request params, which are the same for every
+    # call, along with the validator for the function's arguments.
+    function_dict = json.loads(function_json)
+    tool = cast(ChatCompletionToolParam,
+                {"type": "function", "function": function_dict})
+    request_params = {
+        "tools": [tool],
+        "tool_choice": {"type": "function",
+                        "function": {"name": function_dict["name"]}},
+    }
+    return request_params, _compile_validator(function_dict["parameters"])
+
 
 class OpenAILLM(BaseLLM):
     """
@@ -51,10 +102,11 @@ class OpenAILLM(BaseLLM):
                     These params can be overridden by passing a `model_params` argument to the `chat_completion` or `enforced_function_call` methods.
         """  # noqa: E501
         super().__init__(model_name)
+        self._client_params: Dict[str, Any] = dict(api_key=api_key,
+                                                   organization=organization,
+                                                   base_url=base_url)
         try:
-            self._client = openai.OpenAI(api_key=api_key,
-                                         organization=organization,
-                                         base_url=base_url)
+            self._client = openai.OpenAI(**self._client_params)
         except openai.OpenAIError as e:
             raise RuntimeError(
                 "Failed to connect to OpenAI, please make sure that the OPENAI_API_KEY "
@@ -73,6 +125,15 @@ class OpenAILLM(BaseLLM):
     def available_models(self):
         return [k.id for k in self._client.models.list()]
 
+    @cached_property
+    def _async_client(self) -> openai.AsyncOpenAI:
+        # Created on first use only, since most instances are never used
+        # asynchronously. The configuration was already validated by the sync client.
+        return self._create_async_client()
+
+    def _create_async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(**self._client_params)
+
     def chat_completion(self,
                         system_prompt: str,
                         chat_history: Messages,
@@ -85,7 +146,7 @@ class OpenAILLM(BaseLLM):
         """
         Chat completion using the OpenAI API.
 
-        Note: this function is wrapped in a retry decorator to handle transient errors.
+        Note: transient API errors are retried by the underlying OpenAI client.
 
         Args:
             system_prompt: The system prompt to use for the chat completion.
@@ -112,19 +173,9 @@ class OpenAILLM(BaseLLM):
             "roses are red"
         """  # noqa: E501
 
-        model_params_dict: Dict[str, Any] = deepcopy(self.default_model_params)
-        model_params_dict.update(model_params or {})
-        if max_tokens is not None:
-            model_params_dict["max_tokens"] = max_tokens
-
-        model = model_params_dict.pop("model", self.model_name)
-
-        if context is None:
-            system_message = system_prompt
-        else:
-            system_message = system_prompt + f"\nContext: {context.to_text()}"
-        messages = [SystemMessage(content=system_message).model_dump()
-                    ] + [m.model_dump() for m in chat_history]
+        model, model_params_dict = self._prepare_model_params(max_tokens,
+                                                              model_params)
+        messages = self._prepare_messages(system_prompt, chat_history, context)
         try:
             response = self._client.chat.completions.create(model=model,
                                                             messages=messages,
@@ -156,13 +207,14 @@ class OpenAILLM(BaseLLM):
                                function: Function,
                                *,
                                max_tokens: Optional[int] = None,
-                               model_params: Optional[dict] = None, ) -> dict:
+                               model_params: Optional[dict] = None,
+                               validate_arguments: bool = True, ) -> dict:
         """
         This function enforces the model to respond with a specific function call.
 
         To read more about this feature, see: https://platform.openai.com/docs/guides/gpt/function-calling
 
-        Note: this function is wrapped in a retry decorator to handle transient errors.
+        Note: this function is wrapped in a retry decorator to handle malformed function call arguments.
 
         Args:
             system_prompt: The system prompt to use for the chat completion.
@@ -173,6 +225,8 @@ class OpenAILLM(BaseLLM):
                           Overrides the default model parameters if set on initialization.
                           For example, you can pass: {"temperature": 0.9, "top_p": 1.0} to override the default temperature and top_p.
                           see: https://platform.openai.com/docs/api-reference/chat/create
+            validate_arguments: Whether to validate the returned arguments against the function's parameters schema. Defaults to True.
+                                The model is already constrained to the schema by the API, so this can be turned off to save the validation cost for trusted models.
 
         Returns:
             dict: Function call arguments as a dictionary.
@@ -200,36 +254,23 @@ class OpenAILLM(BaseLLM):
             {'queries': ['capital of France']}
         """  # noqa: E501
 
-        model_params_dict: Dict[str, Any] = deepcopy(self.default_model_params)
-        model_params_dict.update(model_params or {})
-        if max_tokens is not None:
-            model_params_dict["max_tokens"] = max_tokens
-
-        model = model_params_dict.pop("model", self.model_name)
-
-        function_dict = cast(ChatCompletionToolParam,
-                             {"type": "function", "function": function.model_dump()})
-
-        messages = [SystemMessage(content=system_prompt).model_dump()
-                    ] + [m.model_dump() for m in chat_history]
+        model, model_params_dict = self._prepare_model_params(max_tokens,
+                                                              model_params)
+        function_params, validator = self._prepare_function(function)
+        messages = self._prepare_messages(system_prompt, chat_history)
         try:
             chat_completion = self._client.chat.completions.create(
                 model=model,
                 messages=messages,
-                tools=[function_dict],
-                tool_choice={"type": "function",
-                             "function": {"name": function.name}},
-                max_tokens=max_tokens,
+                **function_params,
                 **model_params_dict
             )
         except openai.OpenAIError as e:
             self._handle_chat_error(e, is_function_call=True)
 
-        result = chat_completion.choices[0].message.tool_calls[0].function.arguments
-        arguments = json.loads(result)
-
-        jsonschema.validate(instance=arguments, schema=function.parameters.model_dump())
-        return arguments
+        return self._parse_function_call(
+            chat_completion, validator if validate_arguments else None
+        )
 
     async def achat_completion(self,
                                system_prompt: str,
@@ -240,16 +281,169 @@ class OpenAILLM(BaseLLM):
                                max_generated_tokens: Optional[int] = None,
                                model_params: Optional[dict] = None,
                                ) -> Union[ChatResponse,
-                                          Iterable[StreamingChatChunk]]:
-        raise NotImplementedError()
+                                          AsyncIterable[StreamingChatChunk]]:
+        """
+        Asynchronous version of `chat_completion`.
+
+        Args:
+            system_prompt: The system prompt to use for the chat completion.
+            chat_history: Chat history to use for the chat completion as list of messages.
+            context: Knowledge base context to use for the chat completion. Defaults to None (no context).
+            stream: Whether to stream the response or not.
+            max_generated_tokens: Maximum number of tokens to generate. Defaults to None (generates until stop sequence or until hitting max context size).
+            model_params: Model parameters to use for this request. Defaults to None (uses the default model parameters).
+                          See `chat_completion` for more details.
 
+        Returns:
+            ChatResponse or an async iterator of StreamingChatChunk
+        """  # noqa: E501
+        model, model_params_dict = self._prepare_model_params(max_generated_tokens,
+                                                              model_params)
+        messages = self._prepare_messages(system_prompt, chat_history, context)
+        try:
+            response = await self._async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                stream=stream,
+                **model_params_dict
+            )
+        except openai.OpenAIError as e:
+            self._handle_chat_error(e)
+
+        async def streaming_iterator(chunks: AsyncStream[ChatCompletionChunk]):
+            async for chunk in chunks:
+                yield StreamingChatChunk.model_validate(chunk.model_dump())
+
+        if stream:
+            return streaming_iterator(cast(AsyncStream[ChatCompletionChunk], response))
+
+        return ChatResponse.model_validate(cast(ChatCompletion, response).model_dump())
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception_type(
+            (json.decoder.JSONDecodeError,
+             jsonschema.ValidationError)
+        ),
+    )
     async def aenforced_function_call(self,
                                       system_prompt: str,
                                       chat_history: Messages,
                                       function: Function, *,
                                       max_tokens: Optional[int] = None,
-                                      model_params: Optional[dict] = None):
-        raise NotImplementedError()
+                                      model_params: Optional[dict] = None,
+                                      validate_arguments: bool = True) -> dict:
+        """
+        Asynchronous version of `enforced_function_call`.
+
+        Note: this function is wrapped in a retry decorator to handle malformed function call arguments.
+
+        Args:
+            system_prompt: The system prompt to use for the chat completion.
+            chat_history: Messages (chat history) to send to the model.
+            function: Function to call. See canopy.llm.models.Function for more details.
+            max_tokens: Maximum number of tokens to generate. Defaults to None (generates until stop sequence or until hitting max context size).
+            model_params: Model parameters to use for this request. Defaults to None (uses the default model parameters).
+                          See `enforced_function_call` for more details.
+            validate_arguments: Whether to validate the returned arguments against the function's parameters schema. Defaults to True.
+
+        Returns:
+            dict: Function call arguments as a dictionary.
+        """  # noqa: E501
+        model, model_params_dict = self._prepare_model_params(max_tokens,
+                                                              model_params)
+        function_params, validator = self._prepare_function(function)
+        messages = self._prepare_messages(system_prompt, chat_history)
+        try:
+            chat_completion = await self._async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **function_params,
+                **model_params_dict
+            )
+        except openai.OpenAIError as e:
+            self._handle_chat_error(e, is_function_call=True)
+
+        return self._parse_function_call(
+            chat_completion, validator if validate_arguments else None
+        )
+
+    async def abatch_enforced_function_call(self,
+                                            system_prompt: str,
+                                            chat_histories: List[Messages],
+                                            function: Function,
+                                            *,
+                                            max_tokens: Optional[int] = None,
+                                            model_params: Optional[dict] = None,
+                                            validate_arguments: bool = True,
+                                            ) -> List[dict]:
+        """
+        Run `aenforced_function_call` concurrently for multiple chat histories.
+
+        The requests are sent in parallel over the same async client, so they share its connection pool.
+
+        Args:
+            system_prompt: The system prompt to use for all the chat completions.
+            chat_histories: List of chat histories, one request is sent for each.
+            function: Function to call. See canopy.llm.models.Function for more details.
+            max_tokens: Maximum number of tokens to generate per request. Defaults to None (generates until stop sequence or until hitting max context size).
+            model_params: Model parameters to use for the requests. Defaults to None (uses the default model parameters).
+                          See `enforced_function_call` for more details.
+            validate_arguments: Whether to validate the returned arguments against the function's parameters schema. Defaults to True.
+
+        Returns:
+            List[dict]: Function call arguments for each chat history, in the same order as `chat_histories`.
+        """  # noqa: E501
+        return await asyncio.gather(*[
+            self.aenforced_function_call(system_prompt,
+                                         chat_history,
+                                         function,
+                                         max_tokens=max_tokens,
+                                         model_params=model_params,
+                                         validate_arguments=validate_arguments)
+            for chat_history in chat_histories
+        ])
+
+    def _prepare_model_params(self,
+                              max_tokens: Optional[int],
+                              model_params: Optional[dict]
+                              ) -> Tuple[str, Dict[str, Any]]:
+        model_params_dict: Dict[str, Any] = {**self.default_model_params,
+                                             **(model_params or {})}
+        if max_tokens is not None:
+            model_params_dict["max_tokens"] = max_tokens
+
+        model = model_params_dict.pop("model", self.model_name)
+        return model, model_params_dict
+
+    @staticmethod
+    def _prepare_messages(system_prompt: str,
+                          chat_history: Messages,
+                          context: Optional[Context] = None) -> list:
+        if context is None:
+            system_message = system_prompt
+        else:
+            system_message = system_prompt + f"\nContext: {context.to_text()}"
+        return _MESSAGES_ADAPTER.dump_python(
+            [SystemMessage(content=system_message)] + list(chat_history),
+            mode="json"
+        )
+
+    @staticmethod
+    def _prepare_function(function: Function
+                          ) -> Tuple[Dict[str, Any], Callable[[Any], None]]:
+        return _get_function_spec(function.model_dump_json())
+
+    @staticmethod
+    def _parse_function_call(chat_completion,
+                             validator: Optional[Callable[[Any], None]]) -> dict:
+        result = chat_completion.choices[0].message.tool_calls[0].function.arguments
+        arguments = _json_loads(result)
+
+        if validator is not None:
+            validator(arguments)
+        return arguments
 
     @staticmethod
     def _format_openai_error(e):
@@ -1,8 +1,12 @@
 import os
+from unittest.mock import MagicMock
 
+import httpx
+import openai
 import pytest
 
 from canopy.llm import AzureOpenAILLM
+from canopy.llm import azure_openai_llm as azure_openai_module
 from .test_openai import SYSTEM_PROMPT
 
 MODEL_NAME = os.getenv("AZURE_DEPLOYMENT_NAME")
@@ -35,6 +39,98 @@ def test_init_params(azure_openai_llm):
     assert llm._client._api_version == "2020-05-03"
 
 
+def test_client_shared_between_instances():
+    params = dict(model_name="test_model_name",
+                  azure_endpoint="https://sharing-test.openai.azure.com/",
+                  prewarm=False)
+    llm = AzureOpenAILLM(**params, api_key="test_api_key")
+    same_config_llm = AzureOpenAILLM(**params, api_key="test_api_key",
+                                     temperature=0.5)
+    assert same_config_llm._client is llm._client
+
+    other_llm = AzureOpenAILLM(**params, api_key="other_api_key")
+    assert other_llm._client is not llm._client
+    assert other_llm._client.api_key == "other_api_key"
+
+
+@pytest.fixture()
+def mock_thread(monkeypatch):
+    thread = MagicMock()
+    monkeypatch.setattr(azure_openai_module.threading, "Thread", thread)
+    return thread
+
+
+def test_prewarm_once_per_client(mock_thread):
+    for _ in range(3):
+        AzureOpenAILLM(model_name="test_model_name",
+                       api_key="test_api_key",
+                       azure_endpoint="https://prewarm-test.openai.azure.com/")
+
+    mock_thread.assert_called_once()
+    assert mock_thread.call_args.kwargs["args"][1] == \
+        "https://prewarm-test.openai.azure.com/"
+
+
+def test_prewarm_disabled(mock_thread):
+    AzureOpenAILLM(model_name="test_model_name",
+                   api_key="test_api_key",
+                   azure_endpoint="https://no-prewarm-test.openai.azure.com/",
+                   prewarm=False)
+
+    mock_thread.assert_not_called()
+
+
+def test_prewarm_does_not_affect_client_sharing(mock_thread):
+    params = dict(model_name="test_model_name",
+                  api_key="test_api_key",
+                  azure_endpoint="https://prewarm-sharing-test.openai.azure.com/")
+    cold_llm = AzureOpenAILLM(**params, prewarm=False)
+    mock_thread.assert_not_called()
+
+    warm_llm = AzureOpenAILLM(**params, prewarm=True)
+    assert warm_llm._client is cold_llm._client
+    mock_thread.assert_called_once()
+
+
+@pytest.mark.parametrize("url", ["https://prewarm-test.openai.azure.com/",
+                                 "bad endpoint"])
+def test_prewarm_failure_is_ignored(url):
+    def raise_connect_error(request):
+        raise httpx.ConnectError("Connection failed", request=request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(raise_connect_error))
+    azure_openai_module._prewarm_connection(http_client, url)
+
+
+def test_async_client_created_on_first_use():
+    llm = AzureOpenAILLM(model_name="test_model_name",
+                         api_key="test_api_key",
+                         azure_endpoint="https://async-test.openai.azure.com/",
+                         prewarm=False)
+    assert "_async_client" not in vars(llm)
+
+    async_client = llm._async_client
+    assert isinstance(async_client, openai.AsyncAzureOpenAI)
+    assert async_client.api_key == "test_api_key"
+    assert llm._async_client is async_client
+
+
+def test_http_clients_use_environment_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:8080")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+    llm = AzureOpenAILLM(model_name="test_model_name",
+                         api_key="test_api_key",
+                         azure_endpoint="https://proxy-test.openai.azure.com/",
+                         prewarm=False)
+
+    for http_client in (llm._client._client, llm._async_client._client):
+        mounts = {pattern.pattern: transport
+                  for pattern, transport in http_client._mounts.items()}
+        assert isinstance(mounts["https://"],
+                          (httpx.HTTPTransport, httpx.AsyncHTTPTransport))
+        assert mounts["all://*internal.example.com"] is None
+
+
 @pytest.fixture()
 def no_api_key():
     before = os.environ.pop("AZURE_OPENAI_API_KEY", None)
@@ -1,5 +1,5 @@
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock
 
 import jsonschema
 import pytest
@@ -280,6 +280,125 @@ def test_enforce_function_wrong_output_schema(openai_llm,
         "retry did not happen as expected"
 
 
+def test_enforce_function_max_tokens(openai_llm,
+                                     messages,
+                                     function_query_knowledgebase):
+    openai_llm._client = MagicMock()
+    openai_llm._client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(
+            message=MagicMock(
+                tool_calls=[
+                    MagicMock(
+                        function=MagicMock(
+                            arguments="{\"queries\": [\"query\"]}"))]))])
+
+    result = openai_llm.enforced_function_call(system_prompt=SYSTEM_PROMPT,
+                                               chat_history=messages,
+                                               function=function_query_knowledgebase,
+                                               max_tokens=25)
+
+    assert result == {"queries": ["query"]}
+    _, kwargs = openai_llm._client.chat.completions.create.call_args
+    assert kwargs["max_tokens"] == 25
+
+
+def test_enforce_function_skip_arguments_validation(openai_llm,
+                                                    messages,
+                                                    function_query_knowledgebase):
+    openai_llm._client = MagicMock()
+    openai_llm._client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(
+            message=MagicMock(
+                tool_calls=[
+                    MagicMock(
+                        function=MagicMock(
+                            arguments="{\"key\": \"value\"}"))]))])
+
+    result = openai_llm.enforced_function_call(system_prompt=SYSTEM_PROMPT,
+                                               chat_history=messages,
+                                               function=function_query_knowledgebase,
+                                               validate_arguments=False)
+
+    assert result == {"key": "value"}
+    assert openai_llm._client.chat.completions.create.call_count == 1
+
+
+def test_async_client_created_on_first_use():
+    llm = OpenAILLM(api_key="test_api_key")
+    assert "_async_client" not in vars(llm)
+
+    async_client = llm._async_client
+    assert async_client.api_key == "test_api_key"
+    assert llm._async_client is async_client
+
+
+@pytest.mark.asyncio
+async def test_achat_completion_no_context(openai_llm, messages):
+    response = await openai_llm.achat_completion(system_prompt=SYSTEM_PROMPT,
+                                                 chat_history=messages)
+    assert_chat_completion(response)
+
+
+@pytest.mark.asyncio
+async def test_achat_streaming(openai_llm, messages):
+    response = await openai_llm.achat_completion(system_prompt=SYSTEM_PROMPT,
+                                                 chat_history=messages,
+                                                 stream=True)
+    messages_received = [message async for message in response]
+    assert len(messages_received) > 0
+    for message in messages_received:
+        assert isinstance(message, StreamingChatChunk)
+
+
+@pytest.mark.asyncio
+async def test_aenforced_function_call(openai_llm,
+                                       messages,
+                                       function_query_knowledgebase):
+    result = await openai_llm.aenforced_function_call(
+        system_prompt=SYSTEM_PROMPT,
+        chat_history=messages,
+        function=function_query_knowledgebase)
+    assert_function_call_format(result)
+
+
+@pytest.mark.asyncio
+async def test_abatch_enforced_function_call(openai_llm,
+                                             messages,
+                                             function_query_knowledgebase):
+    results = await openai_llm.abatch_enforced_function_call(
+        system_prompt=SYSTEM_PROMPT,
+        chat_histories=[messages, messages[:1]],
+        function=function_query_knowledgebase)
+    assert len(results) == 2
+    for result in results:
+        assert_function_call_format(result)
+
+
+@pytest.mark.asyncio
+async def test_aenforce_function_wrong_output_schema(openai_llm,
+                                                     messages,
+                                                     function_query_knowledgebase):
+    openai_llm._async_client = MagicMock()
+    openai_llm._async_client.chat.completions.create = AsyncMock(
+        return_value=MagicMock(
+            choices=[MagicMock(
+                message=MagicMock(
+                    tool_calls=[
+                        MagicMock(
+                            function=MagicMock(
+                                arguments="{\"key\": \"value\"}"))]))]))
+
+    with pytest.raises(jsonschema.ValidationError,
+                       match="'queries' is a required property"):
+        await openai_llm.aenforced_function_call(
+            system_prompt=SYSTEM_PROMPT,
+            chat_history=messages,
+            function=function_query_knowledgebase)
+
+    assert openai_llm._async_client.chat.completions.create.call_count == 3, \
+        "retry did not happen as expected"
+
+
 def test_enforce_function_unsupported_model(openai_llm,
                                             messages,
                                             function_query_knowledgebase):